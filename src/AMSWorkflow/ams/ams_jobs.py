@@ -1,29 +1,114 @@
 from flux.job import JobspecV1
 import os
 import json
+import functools
+from itertools import chain
 
 from typing import Optional
-from dataclasses import dataclass, fields
+from dataclasses import dataclass
 from ams import util
 from ams.store import AMSDataStore 
 from ams.rmq import AMSRMQConfiguration
 from typing import Dict, List, Union, Optional, Mapping
-from pathlib import Path
+
+# orjson is an optional (faster) serializer, both variants return the compact JSON encoding as bytes.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Jobs are usually described and submitted in bulk from the same directory. We cache the working directory so every
+# job does not pay a syscall. The environment is not cached, long running callers may modify ``os.environ`` between
+# jobs and every job needs its own copy of it anyway.
+_CWD_CACHE: Optional[str] = None
+_OS_ENVIRON_TYPE = type(os.environ)
+
+
+def _cwd():
+    global _CWD_CACHE
+    if _CWD_CACHE is None:
+        _CWD_CACHE = os.getcwd()
+    return _CWD_CACHE
+
+
+def invalidate_cwd_cache():
+    """Drops the cached working directory. Call this after changing the current directory (e.g. ``os.chdir``)."""
+    global _CWD_CACHE
+    _CWD_CACHE = None
+
+
+@functools.lru_cache(maxsize=256)
+def _jobspec_template(command, num_tasks, num_nodes, cores_per_task, gpus_per_task, exclusive, is_mpi):
+    """
+    Returns the serialized jobspec (without any per-job output files, environment or working directory)
+    of a job with the given shape. Jobs submitted in bulk usually share their shape, so we build and validate
+    the jobspec once and rehydrate it from its JSON representation afterwards.
+    """
+    jobspec = JobspecV1.from_command(
+        command=list(command),
+        num_tasks=num_tasks,
+        num_nodes=num_nodes,
+        cores_per_task=cores_per_task,
+        gpus_per_task=gpus_per_task,
+        exclusive=exclusive,
+    )
+
+    if is_mpi:
+        print("Setting MPI and spectrum")
+        jobspec.setattr_shell_option("mpi", "spectrum")
+    if gpus_per_task:
+        jobspec.setattr_shell_option("gpu-affinity", "per-task")
+    # Recent flux versions fill in the current environment and working directory. Both are set per job,
+    # so we do not keep (and later parse) a copy of them in every cached template.
+    system = jobspec.jobspec["attributes"]["system"]
+    system.pop("environment", None)
+    system.pop("cwd", None)
+    return jobspec.dumps()
+
+
+@functools.lru_cache(maxsize=None)
+def _store_tmp_path(root_path):
+    """
+    Returns the 'tmp' directory of the store rooted at ``root_path`` as a string. The directory is created
+    on the first call, subsequent jobs of the same store skip the filesystem check. Callers writing into
+    the directory need to recreate it (``util.mkdir``) if it has been removed in the meantime.
+    """
+    return str(util.mkdir(root_path, "tmp"))
 
 
 def constuct_cli_cmd(executable, *args, **kwargs):
     command = [executable]
-    for k, v in kwargs.items():
-        command.append(str(k))
-        command.append(str(v))
+    command.extend(map(str, chain.from_iterable(kwargs.items())))
+    command.extend(map(str, args))
+    return command
 
-    for a in args:
-        command.append(str(a))
 
-    return command
+def _build_to_dict(cls, entries: Mapping[str, str], method: str = "to_dict"):
+    """
+    Generates a straight-line ``to_dict`` for ``cls`` and attaches it to the class. The generated function
+    returns a dictionary literal instead of iterating over the entries every time it is called.
+
+    :param cls: The class to attach the generated ``to_dict`` to.
+    :param entries: Maps every key of the returned dictionary to the python expression (in terms of ``self``)
+        computing its value.
+    :param method: The name under which the generated function is attached to ``cls``.
+    """
+    items = ", ".join(f"{key!r}: {expr}" for key, expr in entries.items())
+    namespace = {}
+    exec(f"def {method}(self):\n    return {{{items}}}\n", {}, namespace)
+    func = namespace[method]
+    func.__qualname__ = f"{cls.__qualname__}.{method}"
+    func.__module__ = cls.__module__
+    setattr(cls, method, func)
+    return cls
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AMSJobResources:
     nodes: int
     tasks_per_node: int
@@ -31,8 +116,10 @@ class AMSJobResources:
     exclusive: Optional[bool] = True
     gpus_per_task: Optional[int] = 0
 
-    def to_dict(self):
-        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+# Field names are fixed once the dataclass is created, the slots dataclass already lists them in ``__slots__``
+AMSJobResources._FIELD_NAMES = AMSJobResources.__slots__
+_build_to_dict(AMSJobResources, {n: f"self.{n}" for n in AMSJobResources._FIELD_NAMES})
 
 
 class AMSJob:
@@ -40,8 +127,25 @@ class AMSJob:
     Class Modeling a Job scheduled by AMS. This is a convenience layer on top of a flux JobspecV1
     and provides less features than the flux one. We use this abstraction to describe the job specification
     in the json file.
+
+    ``name``, ``resources``, ``stdout`` and ``stderr`` are plain attributes. ``executable`` and ``environ``
+    are properties, as setting them requires invalidating the cached command line and validating the environment.
     """
 
+    __slots__ = (
+        "name",
+        "resources",
+        "stdout",
+        "stderr",
+        "_executable",
+        "_environ",
+        "_is_mpi",
+        "_ams_log",
+        "_cli_args",
+        "_cli_kwargs",
+        "_cli_cmd_cache",
+    )
+
     @classmethod
     def generate_formatting(cls, store):
         return {"AMS_STORE_PATH": store.root_path}
@@ -50,14 +154,16 @@ class AMSJob:
         self,
         name: str,
         executable: str,
-        environ: Optional[Mapping[str, str]] = {},
+        environ: Optional[Mapping[str, str]] = None,
         resources: Optional[AMSJobResources]=None,
         stdout: Optional[str]=None,
         stderr: Optional[str]=None,
         ams_log: bool=False,
         is_mpi: bool=False,
-        cli_args: Optional[List[str]]=[],
-        cli_kwargs: Optional[Dict[str,str]]={},
+        cli_args: Optional[List[str]]=None,
+        cli_kwargs: Optional[Dict[str,str]]=None,
+        *,
+        _cli_owned: bool=False,
     ):
         """Attaches a callable that will be called when the future finishes.
 
@@ -71,56 +177,58 @@ class AMSJob:
         :param is_mpi: Whether the job is an mpi job.
         :param cli_args: positional arguments of the cli command 
         :param cli_kwargs: key-word arguments of the cli command 
+        :param _cli_owned: Internal, set by subclasses passing freshly built ``cli_args``/``cli_kwargs``
+            which the job can take over without copying them.
         :return: ``self``
         """
 
-        self._name = name
+        self.name = name
         self._executable = executable
-        self._resources = resources
-        if isinstance(self._resources, dict):
-            self._resources = AMSJobResources(**resources)
+        self.resources = resources
+        if isinstance(resources, dict):
+            self.resources = AMSJobResources(**resources)
 
         self.environ = environ
-        self._stdout = stdout
-        self._stderr = stderr
-        self._cli_args = []
-        self._cli_kwargs = {}
+        self.stdout = stdout
+        self.stderr = stderr
         self._is_mpi = is_mpi
         self._ams_log = ams_log
-        if cli_args is not None:
-            self._cli_args = list(cli_args)
-        if cli_kwargs is not None:
-            self._cli_kwargs = dict(cli_kwargs)
+        self._cli_cmd_cache = None
+        if _cli_owned:
+            self._cli_args = cli_args
+            self._cli_kwargs = cli_kwargs
+        else:
+            self._cli_args = [] if cli_args is None else list(cli_args)
+            self._cli_kwargs = {} if cli_kwargs is None else dict(cli_kwargs)
+
+    def _cli_command(self):
+        """Returns the cached command line of the job as a tuple, building it if necessary."""
+        if self._cli_cmd_cache is None:
+            self._cli_cmd_cache = tuple(constuct_cli_cmd(self.executable, *self._cli_args, **self._cli_kwargs))
+        return self._cli_cmd_cache
 
     def generate_cli_command(self):
-        return constuct_cli_cmd(self.executable, *self._cli_args, **self._cli_kwargs)
+        """
+        Returns the command line of the job as a new list, callers are free to modify it.
+        """
+        return list(self._cli_command())
+
+    def _invalidate_cli_command(self):
+        """Drops the cached command line, needs to be called whenever the executable or the cli arguments change."""
+        self._cli_cmd_cache = None
 
     def __str__(self):
-        data = {}
-        data["name"] = self._name
-        data["executable"] = self._executable
-        data["stdout"] = self._stdout
-        data["stderr"] = self._stderr
-        data["cli_args"] = self._cli_args
-        data["cli_kwargs"] = self._cli_kwargs
-        data["resources"] = self._resources
-        return f"{self.__class__.__name__}\nCLI:{' '.join(self.generate_cli_command())}\nJOB-Descr:{data}"
+        data = self._core_dict()
+        data["resources"] = self.resources
+        return f"{self.__class__.__name__}\nCLI:{' '.join(self._cli_command())}\nJOB-Descr:{data}"
 
     def precede_deploy(self, store, rmq=None):
         """
         Will be called by the ams job scheduler just before submitting the job. If there is some modification 
         required to the submission environment a child class can override this method and do the modification.
+        Child classes modifying the cli arguments need to call ``_invalidate_cli_command``.
         """
-        pass
-
-    @property
-    def resources(self):
-        """The resources property."""
-        return self._resources
-
-    @resources.setter
-    def resources(self, value):
-        self._resources = value
+        self._invalidate_cli_command()
 
     @property
     def executable(self):
@@ -130,6 +238,7 @@ class AMSJob:
     @executable.setter
     def executable(self, value):
         self._executable = value
+        self._invalidate_cli_command()
 
     @property
     def environ(self):
@@ -138,7 +247,7 @@ class AMSJob:
 
     @environ.setter
     def environ(self, value):
-        if isinstance(value, type(os.environ)):
+        if isinstance(value, _OS_ENVIRON_TYPE):
             self._environ = dict(value)
             return
         elif not isinstance(value, dict) and value is not None:
@@ -146,81 +255,82 @@ class AMSJob:
 
         self._environ = value
 
-    @property
-    def stdout(self):
-        """The stdout property."""
-        return self._stdout
-
-    @stdout.setter
-    def stdout(self, value):
-        self._stdout = value
-
-    @property
-    def stderr(self):
-        """The stderr property."""
-        return self._stderr
-
-    @stderr.setter
-    def stderr(self, value):
-        self._stderr = value
-
-    @property
-    def name(self):
-        """The name property."""
-        return self._name
-
-    @name.setter
-    def name(self, value):
-        self._name = value
-
     @classmethod
     def from_dict(cls, _dict):
         return cls(**_dict)
 
-    def to_dict(self):
-        data = {}
-        data["name"] = self._name
-        data["executable"] = self._executable
-        data["stdout"] = self._stdout
-        data["stderr"] = self._stderr
-        data["cli_args"] = self._cli_args
-        data["cli_kwargs"] = self._cli_kwargs
-        data["resources"] = self._resources.to_dict()
-        return data
+    def to_dict(self, *, shared=False):
+        """
+        Returns the job description as a dictionary that can be consumed by ``from_dict``.
+
+        :param shared: When True the returned dictionary references the cli arguments of the job instead of copies.
+            This avoids the copies when the dictionary is only serialized, the caller must not modify it.
+        :return: A dictionary describing the job
+        """
+        if shared:
+            return self._to_dict_shared()
+        return self._to_dict_copy()
 
     def to_flux_jobspec(self):
-        jobspec = JobspecV1.from_command(
-            command=self.generate_cli_command(),
-            num_tasks=self.resources.tasks_per_node * self.resources.nodes,
-            num_nodes=self.resources.nodes,
-            cores_per_task=self.resources.cores_per_task,
-            gpus_per_task=self.resources.gpus_per_task,
-            exclusive=self.resources.exclusive,
+        resources = self.resources
+        jobspec = JobspecV1(
+            **json.loads(
+                _jobspec_template(
+                    self._cli_command(),
+                    resources.tasks_per_node * resources.nodes,
+                    resources.nodes,
+                    resources.cores_per_task,
+                    resources.gpus_per_task,
+                    resources.exclusive,
+                    bool(self._is_mpi),
+                )
+            )
         )
 
-        if self._is_mpi is not None:
-            print("Setting MPI and spectrum")
-            jobspec.setattr_shell_option("mpi", "spectrum")
-        if self.resources.gpus_per_task is not None:
-            jobspec.setattr_shell_option("gpu-affinity", "per-task")
-        jobspec.stdout = self.stdout
-        jobspec.stderr = self.stderr
-        if self._stdout is None:
-            jobspec.stdout = "ams_test.out"
-        if self._stderr is None:
-            jobspec.stderr = "ams_test.err"
-
-        jobspec.environment = dict(self.environ)
-        jobspec.cwd = os.getcwd()
+        jobspec.stdout = self.stdout or "ams_test.out"
+        jobspec.stderr = self.stderr or "ams_test.err"
+
+        # Flux keeps a reference to the environment, every jobspec needs its own copy.
+        jobspec.environment = {} if self.environ is None else dict(self.environ)
+        jobspec.cwd = _cwd()
 
         return jobspec
 
 
+# NOTE: The keys need to match the arguments of ``AMSJob.__init__`` so that ``from_dict`` can consume them.
+# Subclasses (e.g. ``AMSDomainJob``) inherit ``_core_dict`` (used by ``__str__``) and the ``to_dict`` variants.
+_AMS_JOB_CORE_ENTRIES = {
+    "name": "self.name",
+    "executable": "self._executable",
+    "stdout": "self.stdout",
+    "stderr": "self.stderr",
+    "cli_args": "self._cli_args",
+    "cli_kwargs": "self._cli_kwargs",
+}
+_build_to_dict(AMSJob, _AMS_JOB_CORE_ENTRIES, method="_core_dict")
+_build_to_dict(
+    AMSJob, {**_AMS_JOB_CORE_ENTRIES, "resources": "self.resources.to_dict()"}, method="_to_dict_shared"
+)
+_build_to_dict(
+    AMSJob,
+    {
+        **_AMS_JOB_CORE_ENTRIES,
+        "cli_args": "list(self._cli_args)",
+        "cli_kwargs": "dict(self._cli_kwargs)",
+        "resources": "self.resources.to_dict()",
+    },
+    method="_to_dict_copy",
+)
+
+
 class AMSDomainJob(AMSJob):
     """
     The ``AMSDomainJob`` represents a job executing the original physics code that should be linked in with ``AMSlib``.
     ``AMSDomainJob`` modifies the environment of the executing job just before submission using the ``precede_deploy`` hook. 
     """
+
+    __slots__ = ("_domain_names", "stage_dir", "_ams_object", "_ams_object_fn")
+
     def _generate_ams_objects_store(self, store, rmq):
         '''
         Generates the dictionary requirements of the ``AMSlib`` database description. 
@@ -255,9 +365,11 @@ class AMSDomainJob(AMSJob):
         ams_object["ml_models"] = dict()
         ams_object["domain_models"] = dict()
 
+        results = store.search_many(self.domain_names, entry="models", version="latest")
         for i, name in enumerate(self.domain_names):
-            models = store.search(domain_name=name, entry="models", version="latest")
-            print(json.dumps(models, indent=6))
+            models = results[name]
+            if self._ams_log:
+                print(json.dumps(models, indent=6))
             # This is the case in which we do not have any model
             # Thus we create a data gathering entry
             if len(models) == 0:
@@ -308,6 +420,8 @@ class AMSDomainJob(AMSJob):
             environ=os.environ,
             resources=domain_job_resources,
             ams_log=descr["ams_log"] if "ams_log" in descr else False,
+            # Domain jobs are the (MPI) applications running AMS, they use spectrum MPI unless requested otherwise.
+            is_mpi=descr.get("is_mpi", True),
             **descr["cli"],
         )
 
@@ -322,21 +436,34 @@ class AMSDomainJob(AMSJob):
         :return: A dictionary with the correct structure
         '''
 
+        super().precede_deploy(store, rmq)
         self._ams_object = self._generate_ams_object(store, rmq)
-        tmp_path = util.mkdir(store.root_path, "tmp")
+        tmp_path = _store_tmp_path(store.root_path)
         # NOTE: THere is a big assumption here that the job-to be submitted has access to this tmp path
         # currently we place it under tmp_path which is under the AMSDataStore directory.
         self._ams_object_fn = f"{tmp_path}/{util.get_unique_fn()}.json"
-        with open(self._ams_object_fn, "w") as fd:
-            json.dump(self._ams_object, fd)
-
-        self.environ["AMS_OBJECTS"] = str(self._ams_object_fn)
+        data = _json_dumps(self._ams_object)
+        try:
+            with open(self._ams_object_fn, "wb") as fd:
+                fd.write(data)
+        except FileNotFoundError:
+            # The cached 'tmp' directory has been removed since we last checked it
+            util.mkdir(store.root_path, "tmp")
+            with open(self._ams_object_fn, "wb") as fd:
+                fd.write(data)
+
+        # NOTE: The job environment may be a dictionary owned by the caller, never modify it in place.
+        environ = dict(self.environ or {})
+        environ["AMS_OBJECTS"] = self._ams_object_fn
         if self._ams_log:
             print("Setting log level")
-            self.environ["AMS_LOG_LEVEL"] = "debug"
+            environ["AMS_LOG_LEVEL"] = "debug"
+        self.environ = environ
 
 
 class AMSMLJob(AMSJob):
+    __slots__ = ("_domain",)
+
     def __init__(self, domain, *args, **kwargs):
         '''
         A AMSJob training or performing sub-selection. This is a class mainly representing a team 
@@ -362,12 +489,13 @@ class AMSMLJob(AMSJob):
         cli_kwargs = descr["cli"].get("cli_kwargs", None)
         if cli_kwargs is not None:
             for k, v in cli_kwargs.items():
-                if isinstance(v, str):
-                    cli_kwargs[k] = v.format(**formatting)
+                if isinstance(v, str) and ("{" in v or "}" in v):
+                    cli_kwargs[k] = v.format_map(formatting)
         cli_args = descr["cli"].get("cli_args", None)
         if cli_args is not None:
             for i, v in enumerate(cli_args):
-                cli_args[i] = v.format(**formatting)
+                if isinstance(v, str) and ("{" in v or "}" in v):
+                    cli_args[i] = v.format_map(formatting)
 
         return cls(
             descr["domain_name"],
@@ -384,11 +512,15 @@ class AMSMLJob(AMSJob):
 
 
 class AMSMLTrainJob(AMSMLJob):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
 
 class AMSSubSelectJob(AMSMLJob):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -398,6 +530,9 @@ class AMSStageJob(AMSJob):
     A Job description for stating data from the application to the database. This class is internal
     and should be either inheritted by ``AMSFSTempStageJob`` or ``AMSNetworkStageJob``
     """
+
+    __slots__ = ()
+
     def __init__(
         self,
         resources: Union[Dict[str, Union[str, int]], AMSJobResources],
@@ -411,23 +546,23 @@ class AMSStageJob(AMSJob):
         environ: Optional[Mapping[str, str]] = None,
         stdout: Optional[str] = None,
         stderr: Optional[str] = None,
-        cli_args: List[str] = [],
-        cli_kwargs: Mapping[str, str] = {},
+        cli_args: Optional[List[str]] = None,
+        cli_kwargs: Optional[Mapping[str, str]] = None,
     ):
-        _cli_args = list(cli_args)
-        if store:
-            _cli_args.append("--store")
-        else:
-            _cli_args.append("--no-store")
-
-        _cli_kwargs = dict(cli_kwargs)
-        _cli_kwargs["--dest"] = dest
-        _cli_kwargs["--persistent-db-path"] = persistent_db_path
-        _cli_kwargs["--db-type"] = db_type
-        _cli_kwargs["--policy"] = policy
+        cli_args = () if cli_args is None else cli_args
+        cli_kwargs = {} if cli_kwargs is None else cli_kwargs
+        _cli_args = [*cli_args, "--store" if store else "--no-store"]
+        _cli_kwargs = {
+            **cli_kwargs,
+            "--dest": dest,
+            "--persistent-db-path": persistent_db_path,
+            "--db-type": db_type,
+            "--policy": policy,
+        }
 
         if prune_module_path is not None:
-            assert Path(prune_module_path).exists(), "Module path to user pruner does not exist"
+            if not os.path.exists(prune_module_path):
+                raise FileNotFoundError(f"Module path to user pruner does not exist: {prune_module_path}")
             assert prune_class is not None, "When defining a pruning module please define the class"
             _cli_kwargs["--load"] = prune_module_path
             _cli_kwargs["--class"] = prune_class
@@ -441,6 +576,8 @@ class AMSStageJob(AMSJob):
             stderr=stderr,
             cli_args=_cli_args,
             cli_kwargs=_cli_kwargs,
+            # The cli containers are built above and owned by this job, avoid copying them again in ``AMSJob``
+            _cli_owned=True,
         )
 
 
@@ -449,6 +586,8 @@ class AMSFSStageJob(AMSStageJob):
     A job description for moving data from the application to the database reading the data from the filessytem.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         resources: Union[Dict[str, Union[str, int]], AMSJobResources],
@@ -464,16 +603,11 @@ class AMSFSStageJob(AMSStageJob):
         environ: Optional[Mapping[str, str]] = None,
         stdout: Optional[str] = None,
         stderr: Optional[str] = None,
-        cli_args: List[str] = [],
-        cli_kwargs: Mapping[str, str] = {},
+        cli_args: Optional[List[str]] = None,
+        cli_kwargs: Optional[Mapping[str, str]] = None,
     ):
-
-        _cli_args = list(cli_args)
-        _cli_kwargs = dict(cli_kwargs)
-        _cli_kwargs["--src"] = src
-        _cli_kwargs["--src-type"] = src_type
-        _cli_kwargs["--pattern"] = pattern
-        _cli_kwargs["--mechanism"] = "fs"
+        cli_kwargs = {} if cli_kwargs is None else cli_kwargs
+        _cli_kwargs = {**cli_kwargs, "--src": src, "--src-type": src_type, "--pattern": pattern, "--mechanism": "fs"}
 
         super().__init__(
             resources,
@@ -486,7 +620,7 @@ class AMSFSStageJob(AMSStageJob):
             stderr=stderr,
             prune_module_path=prune_module_path,
             prune_class=prune_class,
-            cli_args=_cli_args,
+            cli_args=cli_args,
             cli_kwargs=_cli_kwargs,
         )
 
@@ -496,6 +630,9 @@ class AMSNetworkStageJob(AMSStageJob):
     A job description for transfering data from the application to the database reading using rmq server-client protocol.
     This class represents the consumer part of the transactions.
     """
+
+    __slots__ = ()
+
     def __init__(
         self,
         resources: Union[Dict[str, Union[str, int]], AMSJobResources],
@@ -510,15 +647,15 @@ class AMSNetworkStageJob(AMSStageJob):
         environ: Optional[Mapping[str, str]] = None,
         stdout: Optional[str] = None,
         stderr: Optional[str] = None,
-        cli_args: List[str] = [],
-        cli_kwargs: Mapping[str, str] = {},
+        cli_args: Optional[List[str]] = None,
+        cli_kwargs: Optional[Mapping[str, str]] = None,
     ):
-        _cli_args = list(cli_args)
+        cli_args = () if cli_args is None else cli_args
+        cli_kwargs = {} if cli_kwargs is None else cli_kwargs
+        _cli_args = cli_args
         if update_models:
-            _cli_args.append("--update-rmq-models")
-        _cli_kwargs = dict(cli_kwargs)
-        _cli_kwargs["--creds"] = creds
-        _cli_kwargs["--mechanism"] = "network"
+            _cli_args = [*cli_args, "--update-rmq-models"]
+        _cli_kwargs = {**cli_kwargs, "--creds": creds, "--mechanism": "network"}
 
         super().__init__(
             resources,
@@ -541,6 +678,8 @@ class AMSNetworkStageJob(AMSStageJob):
 
 
 class AMSFSTempStageJob(AMSJob):
+    __slots__ = ()
+
     def __init__(
         self,
         store_dir,
@@ -552,23 +691,26 @@ class AMSFSTempStageJob(AMSJob):
         stderr=None,
         prune_module_path=None,
         prune_class=None,
-        cli_args=[],
-        cli_kwargs={},
+        cli_args=None,
+        cli_kwargs=None,
     ):
-        _cli_args = list(cli_args)
-        _cli_args.append("--store")
-        _cli_kwargs = dict(cli_kwargs)
-        _cli_kwargs["--dest"] = dest_dir
-        _cli_kwargs["--src"] = src_dir
-        _cli_kwargs["--pattern"] = "*.h5"
-        _cli_kwargs["--db-type"] = "dhdf5"
-        _cli_kwargs["--mechanism"] = "fs"
-        _cli_kwargs["--policy"] = "process"
-        _cli_kwargs["--persistent-db-path"] = store_dir
-        _cli_kwargs["--src"] = src_dir
+        cli_args = () if cli_args is None else cli_args
+        cli_kwargs = {} if cli_kwargs is None else cli_kwargs
+        _cli_args = [*cli_args, "--store"]
+        _cli_kwargs = {
+            **cli_kwargs,
+            "--dest": dest_dir,
+            "--src": src_dir,
+            "--pattern": "*.h5",
+            "--db-type": "dhdf5",
+            "--mechanism": "fs",
+            "--policy": "process",
+            "--persistent-db-path": store_dir,
+        }
 
         if prune_module_path is not None:
-            assert Path(prune_module_path).exists(), "Module path to user pruner does not exist"
+            if not os.path.exists(prune_module_path):
+                raise FileNotFoundError(f"Module path to user pruner does not exist: {prune_module_path}")
             _cli_kwargs["--load"] = prune_module_path
             _cli_kwargs["--class"] = prune_class
 
@@ -581,6 +723,8 @@ class AMSFSTempStageJob(AMSJob):
             stderr=stderr,
             cli_args=_cli_args,
             cli_kwargs=_cli_kwargs,
+            # The cli containers are built above and owned by this job, avoid copying them again in ``AMSJob``
+            _cli_owned=True,
         )
 
     @staticmethod
@@ -599,6 +743,9 @@ class AMSOrchestratorJob(AMSJob):
     A JOB to be scheduled "somewhere" that can schedule jobs "somewhere" else. Currently this is tested only when 
     the orchestrator schedules jobs within the same job-allocation
     """
+
+    __slots__ = ()
+
     def __init__(self, flux_uri, rmq_config):
         super().__init__(
             name="AMSOrchestrator",
@@ -634,7 +781,7 @@ def nested_instance_job_descr(num_nodes, cores_per_node, gpus_per_node, time="in
         jobspec.stdout = stdout
     if stderr is not None:
         jobspec.stderr = stderr
-    jobspec.cwd = os.getcwd()
+    jobspec.cwd = _cwd()
     jobspec.environment = dict(os.environ)
     return jobspec
 
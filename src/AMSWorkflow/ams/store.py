@@ -438,9 +438,10 @@ class AMSDataStore:
 
         return self.close()
 
-    def get_raw_content(self, domain_name, entry):
+    def get_raw_content(self, domain_name, entry, names=None):
         """
-        Returns a dictionary with all data in our AMS store
+        Returns a dictionary with all data in our AMS store. When 'names' is given, only the ensembles
+        (domains) contained in it are walked.
         """
 
         if domain_name is None:
@@ -455,6 +456,8 @@ class AMSDataStore:
 
         data = {}
         for e in ensembles:
+            if names is not None and e.name not in names:
+                continue
             data[e.name] = {}
             for entry_type in entries:
                 data[e.name][entry_type] = {}
@@ -502,6 +505,40 @@ class AMSDataStore:
         self._add_entry(domain_name, dest_entry, "hdf5", new_files)
         self._remove_entry_file(domain_name, src_entry, files, True)
 
+    @staticmethod
+    def _match_contents(d_name, contents, version, metadata):
+        """
+        Collects the entries of a single domain (as returned by 'get_raw_content') that match
+        the requested version and metadata.
+        """
+        found = []
+        for e_name, entries in contents.items():
+            for ver, dsets in entries.items():
+                if version is not None:
+                    if (version != "latest") and (version != ver):
+                        continue
+
+                for dset in dsets:
+                    insert = True
+                    for k, v in metadata.items():
+                        if k in dset.keys():
+                            if dset[k] != v:
+                                insert = False
+                                break
+                        else:
+                            insert = False
+                            break
+                    if insert:
+                        value = {"domain": d_name, "entry": e_name, "version": ver, "file": dset["uri"]}
+                        value.update(dset)
+                        del value["fast_sha"]
+                        del value["mime_type"]
+                        del value["associated"]
+                        del value["id"]
+                        del value["uri"]
+                        found.append(value)
+        return found
+
     def search(self, domain_name=None, entry=None, version=None, metadata=dict()):
         """
         Search for items in the database that match the metadata
@@ -520,37 +557,39 @@ class AMSDataStore:
         found = []
 
         for d_name, contents in all_contents.items():
-            for e_name, entries in contents.items():
-                for ver, dsets in entries.items():
-                    if version is not None:
-                        if (version != "latest") and (version != ver):
-                            continue
-
-                    for dset in dsets:
-                        insert = True
-                        for k, v in metadata.items():
-                            if k in dset.keys():
-                                if dset[k] != v:
-                                    insert = False
-                                    break
-                            else:
-                                insert = False
-                                break
-                        if insert:
-                            value = {"domain": d_name, "entry": e_name, "version": ver, "file": dset["uri"]}
-                            value.update(dset)
-                            del value["fast_sha"]
-                            del value["mime_type"]
-                            del value["associated"]
-                            del value["id"]
-                            del value["uri"]
-                            found.append(value)
+            found.extend(self._match_contents(d_name, contents, version, metadata))
 
         if len(found) != 0 and version == "latest":
             found = [max(found, key=lambda item: item["version"])]
 
         return found
 
+    def search_many(self, domain_names, entry=None, version=None, metadata=dict()):
+        """
+        Search for items of multiple domains in the database that match the metadata.
+        Contrary to calling 'search' once per domain, the store is queried only once.
+        Args:
+            domain_names: The domains to search for
+            entry: Which entry to search for ('data', 'models', 'candidates')
+            version: Specific version to look for, when 'version' is 'latest' we
+                return the entry with the largest version of every domain. If None,
+                we are not matching versions.
+            metadata: A dictionary of key values to search in our database
+
+        Returns:
+            A dictionary mapping every domain name to the list of its matching entries
+        """
+        all_contents = self.get_raw_content(None, entry, names=set(domain_names))
+
+        results = dict()
+        for d_name in domain_names:
+            found = self._match_contents(d_name, all_contents.get(d_name, {}), version, metadata)
+            if len(found) != 0 and version == "latest":
+                found = [max(found, key=lambda item: item["version"])]
+            results[d_name] = found
+
+        return results
+
     def __str__(self):
         return "AMS Kosh Wrapper Store(path={0}, name={1}, status={2})".format(
             self._store_path, self._name, "Open" if self.is_open() else "Closed"
@@ -124,7 +124,7 @@ class AMSWorkflowManager:
                         {
                             "domain_name": ml_job.domain,
                             "job_type": "train",
-                            "spec": ml_job.to_dict(),
+                            "spec": ml_job.to_dict(shared=True),
                             "ams_log": True,
                             "request_type": "register_job_spec",
                         }
@@ -138,7 +138,7 @@ class AMSWorkflowManager:
                         {
                             "domain_name": subselect_job.domain,
                             "job_type": "sub_select",
-                            "spec": subselect_job.to_dict(),
+                            "spec": subselect_job.to_dict(shared=True),
                             "ams_log": True,
                             "request_type": "register_job_spec",
                         }
@@ -0,0 +1,254 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from dataclasses import fields
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from ams import ams_jobs
+
+
+def create_job(cls=ams_jobs.AMSJob, *args, **kwargs):
+    return cls(
+        *args,
+        name="test",
+        executable="echo",
+        resources=ams_jobs.AMSJobResources(nodes=1, tasks_per_node=1),
+        cli_args=["hello"],
+        cli_kwargs={"--key": "value"},
+        **kwargs,
+    )
+
+
+class TestAMSJobCLICommand(unittest.TestCase):
+    def test_generate_cli_command(self):
+        job = create_job()
+        self.assertEqual(job.generate_cli_command(), ["echo", "--key", "value", "hello"])
+
+    def test_returned_command_is_a_copy(self):
+        job = create_job()
+        command = job.generate_cli_command()
+        command.append("--extra")
+        self.assertEqual(job.generate_cli_command(), ["echo", "--key", "value", "hello"])
+
+    def test_executable_setter_invalidates(self):
+        job = create_job()
+        job.generate_cli_command()
+        job.executable = "printf"
+        self.assertEqual(job.generate_cli_command()[0], "printf")
+
+    def test_precede_deploy_invalidates(self):
+        job = create_job()
+        job.generate_cli_command()
+        job._cli_args.append("world")
+        job.precede_deploy(None)
+        self.assertEqual(job.generate_cli_command(), ["echo", "--key", "value", "hello", "world"])
+
+    def test_domain_precede_deploy_invalidates(self):
+        with tempfile.TemporaryDirectory() as root_path:
+            store = MagicMock()
+            store.root_path = Path(root_path)
+            store.search_many.return_value = {"domain": []}
+            job = create_job(ams_jobs.AMSDomainJob, ["domain"], root_path)
+            job.generate_cli_command()
+            job._cli_args.append("world")
+            job.precede_deploy(store)
+            self.assertEqual(job.generate_cli_command(), ["echo", "--key", "value", "hello", "world"])
+            self.assertTrue(Path(job.environ["AMS_OBJECTS"]).exists())
+
+    def test_stage_job_cli_command(self):
+        resources = ams_jobs.AMSJobResources(nodes=1, tasks_per_node=1)
+        job = ams_jobs.AMSNetworkStageJob(resources, "dest", "db", "creds", update_models=True, cli_args=["extra"])
+        self.assertEqual(
+            job.generate_cli_command(),
+            [
+                "AMSDBStage",
+                "--creds",
+                "creds",
+                "--mechanism",
+                "network",
+                "--dest",
+                "dest",
+                "--persistent-db-path",
+                "db",
+                "--db-type",
+                "dhdf5",
+                "--policy",
+                "process",
+                "extra",
+                "--update-rmq-models",
+                "--store",
+            ],
+        )
+
+
+class FakeJobspec:
+    """Minimal stand-in of ``flux.job.JobspecV1``, it keeps environment and cwd by reference as flux does."""
+
+    def __init__(self, resources, tasks, attributes, version=1):
+        self.jobspec = {"resources": resources, "tasks": tasks, "attributes": attributes, "version": version}
+
+    @classmethod
+    def from_command(cls, command, **kwargs):
+        system = {"duration": 0, "environment": dict(os.environ), "cwd": os.getcwd()}
+        return cls([kwargs], [{"command": command}], {"system": system})
+
+    def setattr_shell_option(self, key, value):
+        self.jobspec["attributes"]["system"].setdefault("shell", {}).setdefault("options", {})[key] = value
+
+    def dumps(self):
+        return json.dumps(self.jobspec)
+
+    def _system_property(key):
+        def fset(self, value):
+            self.jobspec["attributes"]["system"][key] = value
+
+        return property(lambda self: self.jobspec["attributes"]["system"][key], fset)
+
+    environment = _system_property("environment")
+    cwd = _system_property("cwd")
+    stdout = _system_property("stdout")
+    stderr = _system_property("stderr")
+    del _system_property
+
+
+class TestAMSJobFluxJobspec(unittest.TestCase):
+    def setUp(self):
+        ams_jobs._jobspec_template.cache_clear()
+        self.addCleanup(ams_jobs._jobspec_template.cache_clear)
+        patcher = patch("ams.ams_jobs.JobspecV1", FakeJobspec)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_template_cache_shared(self):
+        first = create_job(stdout="first.out", stderr="first.err", environ={"VAR": "first"})
+        second = create_job(stdout="second.out", stderr="second.err", environ={"VAR": "second"})
+        first_spec = first.to_flux_jobspec()
+        second_spec = second.to_flux_jobspec()
+
+        info = ams_jobs._jobspec_template.cache_info()
+        self.assertEqual((info.currsize, info.misses, info.hits), (1, 1, 1))
+
+        self.assertEqual(first_spec.environment, {"VAR": "first"})
+        self.assertEqual(second_spec.environment, {"VAR": "second"})
+        self.assertIsNot(first_spec.environment, first.environ)
+        self.assertIsNot(first_spec.environment, second_spec.environment)
+        self.assertEqual((first_spec.stdout, first_spec.stderr), ("first.out", "first.err"))
+        self.assertEqual((second_spec.stdout, second_spec.stderr), ("second.out", "second.err"))
+        self.assertEqual(first_spec.cwd, os.getcwd())
+        self.assertEqual(second_spec.cwd, os.getcwd())
+
+        first_spec.environment["VAR"] = "changed"
+        self.assertEqual(second.to_flux_jobspec().environment, {"VAR": "second"})
+        self.assertEqual(first.environ, {"VAR": "first"})
+
+    def test_template_excludes_environment(self):
+        create_job(environ={"VAR": "value"}).to_flux_jobspec()
+        other = create_job(environ=None).to_flux_jobspec()
+        self.assertEqual(other.environment, {})
+
+    def test_template_cache_per_shape(self):
+        create_job().to_flux_jobspec()
+        job = create_job()
+        job.resources = ams_jobs.AMSJobResources(nodes=2, tasks_per_node=1)
+        job.to_flux_jobspec()
+        self.assertEqual(ams_jobs._jobspec_template.cache_info().currsize, 2)
+
+
+class TestAMSDomainJob(unittest.TestCase):
+    def test_from_descr_is_mpi(self):
+        descr = {
+            "name": "test",
+            "domain_names": ["domain"],
+            "resources": {"nodes": 1, "tasks_per_node": 1},
+            "cli": {"executable": "echo"},
+        }
+        self.assertTrue(ams_jobs.AMSDomainJob.from_descr(descr)._is_mpi)
+        self.assertFalse(ams_jobs.AMSDomainJob.from_descr({**descr, "is_mpi": False})._is_mpi)
+
+    def test_precede_deploy_recreates_removed_tmp_dir(self):
+        with tempfile.TemporaryDirectory() as root_path:
+            store = MagicMock()
+            store.root_path = Path(root_path)
+            store.search_many.return_value = {"domain": []}
+            job = create_job(ams_jobs.AMSDomainJob, ["domain"], root_path)
+            job.precede_deploy(store)
+            shutil.rmtree(Path(root_path) / "tmp")
+            job.precede_deploy(store)
+            self.assertTrue(Path(job.environ["AMS_OBJECTS"]).exists())
+
+
+class TestAMSJobSlots(unittest.TestCase):
+    def test_jobs_have_no_dict(self):
+        resources = ams_jobs.AMSJobResources(nodes=1, tasks_per_node=1)
+        jobs = [
+            create_job(),
+            create_job(ams_jobs.AMSDomainJob, ["domain"], None),
+            create_job(ams_jobs.AMSMLTrainJob, "domain"),
+            create_job(ams_jobs.AMSSubSelectJob, "domain"),
+            ams_jobs.AMSFSStageJob(resources, "dest", "db", "src"),
+            ams_jobs.AMSNetworkStageJob(resources, "dest", "db", "creds"),
+            ams_jobs.AMSFSTempStageJob("db", "src", "dest", resources),
+            ams_jobs.AMSOrchestratorJob("uri", "rmq.json"),
+        ]
+        for job in jobs:
+            with self.subTest(cls=type(job).__name__):
+                self.assertFalse(hasattr(job, "__dict__"))
+
+
+class TestAMSJobEnviron(unittest.TestCase):
+    def test_environ_follows_os_environ(self):
+        first = create_job(environ=os.environ)
+        os.environ["AMS_TEST_ENVIRON"] = "1"
+        try:
+            second = create_job(environ=os.environ)
+        finally:
+            del os.environ["AMS_TEST_ENVIRON"]
+        self.assertNotIn("AMS_TEST_ENVIRON", first.environ)
+        self.assertEqual(second.environ["AMS_TEST_ENVIRON"], "1")
+        self.assertIsNot(first.environ, second.environ)
+
+
+class TestAMSJobToDict(unittest.TestCase):
+    def test_resources_to_dict(self):
+        resources = ams_jobs.AMSJobResources(nodes=2, tasks_per_node=4, gpus_per_task=1)
+        data = resources.to_dict()
+        self.assertEqual(list(data.keys()), [f.name for f in fields(ams_jobs.AMSJobResources)])
+        self.assertEqual(ams_jobs.AMSJobResources(**data), resources)
+
+    def test_round_trip(self):
+        job = create_job(stdout="test.out", stderr="test.err")
+        data = job.to_dict()
+        self.assertEqual(ams_jobs.AMSJob.from_dict(data).to_dict(), data)
+        self.assertEqual(
+            data,
+            {
+                "name": "test",
+                "executable": "echo",
+                "stdout": "test.out",
+                "stderr": "test.err",
+                "cli_args": ["hello"],
+                "cli_kwargs": {"--key": "value"},
+                "resources": job.resources.to_dict(),
+            },
+        )
+
+    def test_to_dict_copies(self):
+        job = create_job()
+        data = job.to_dict()
+        data["cli_args"].append("world")
+        data["cli_kwargs"]["--other"] = "value"
+        self.assertEqual(job.generate_cli_command(), ["echo", "--key", "value", "hello"])
+
+    def test_to_dict_shared(self):
+        job = create_job()
+        data = job.to_dict(shared=True)
+        self.assertIs(data["cli_args"], job._cli_args)
+        self.assertIs(data["cli_kwargs"], job._cli_kwargs)
+        self.assertEqual(data, job.to_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
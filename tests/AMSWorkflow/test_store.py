@@ -118,6 +118,31 @@ class TestStore(unittest.TestCase):
         self.assertTrue(len(versions) == 0, f"Store should be empty but isn't {versions}")
         ams_store.close()
 
+    def test_store_search_many(self):
+        ams_store = store.AMSDataStore(self.__class__.store_dir, "test.sql", "ams_test")
+        ams_store = ams_store.open()
+        domains = ["test_a", "test_b"]
+        for j, domain in enumerate(domains):
+            for i, m in enumerate(self.__class__.model_files[j::2]):
+                ams_store.add_model(
+                    domain,
+                    AMSModelDescr(path=m, threshold=0.5, uq_type=UQType.Random),
+                    0.1,
+                    0.1,
+                    version=i,
+                )
+
+        results = ams_store.search_many(domains + ["test_missing"], entry="models", version="latest")
+        for domain in domains:
+            self.assertEqual(results[domain], ams_store.search(domain, entry="models", version="latest"))
+            self.assertEqual(len(results[domain]), 1)
+        self.assertEqual(results["test_missing"], [])
+        self.assertEqual(list(ams_store.get_raw_content(None, "models", names={"test_a"})), ["test_a"])
+
+        for j, domain in enumerate(domains):
+            ams_store.remove_models(domain, self.__class__.model_files[j::2], False)
+        ams_store.close()
+
     @classmethod
     def tearDownClass(cls):
         for _list in [cls.h5_files, cls.model_files, cls.candidate_files]: